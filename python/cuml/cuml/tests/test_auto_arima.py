@@ -18,9 +18,10 @@ from cuml.internals.input_utils import input_to_cuml_array
 from cuml.tsa import auto_arima
 import pytest
 
-from cuml.internals.safe_imports import cpu_only_import
+from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
 
 np = cpu_only_import("numpy")
+cp = gpu_only_import("cupy")
 
 
 ###############################################################################
@@ -223,3 +224,111 @@ def test_merge_series(batch_size, n_obs, n_sub, dtype):
 
     # Compare the results
     np.testing.assert_allclose(data.to_output("numpy"), data_np)
+
+
+def test_pad_start_params():
+    """Test the helper that pads the parameters of a previous fit to
+    warm-start a model with larger orders
+    """
+    batch_size = 3
+    prev_params = {
+        "mu": cp.array([0.1, 0.2, 0.3]),
+        "ar": cp.array([[0.5, 0.6, 0.7]]),
+        "sma": cp.array([[-0.3, -0.2, -0.1]]),
+        "sigma2": cp.array([1.0, 1.1, 1.2]),
+    }
+    prev_spec = (1, 0, 0, 1, 1)
+
+    # Growing orders: previous values are kept and the new lags are zero
+    start_params = auto_arima._pad_start_params(
+        prev_params, prev_spec, (2, 1, 1, 2, 1), batch_size
+    )
+    for name in ["mu", "sigma2"]:
+        np.testing.assert_array_equal(
+            cp.asnumpy(start_params[name]), cp.asnumpy(prev_params[name])
+        )
+    for name in ["ar", "sma"]:
+        np.testing.assert_array_equal(
+            cp.asnumpy(start_params[name][:1]), cp.asnumpy(prev_params[name])
+        )
+        np.testing.assert_array_equal(
+            cp.asnumpy(start_params[name][1:]), np.zeros((1, batch_size))
+        )
+    for name in ["ma", "sar"]:
+        np.testing.assert_array_equal(
+            cp.asnumpy(start_params[name]), np.zeros((1, batch_size))
+        )
+
+    # Shrinking any order: no valid start point, fall back to a cold start
+    assert (
+        auto_arima._pad_start_params(
+            prev_params, prev_spec, (0, 0, 0, 1, 1), batch_size
+        )
+        is None
+    )
+
+
+def test_pad_start_params_intercept():
+    """Test the handling of the intercept when it appears or disappears
+    between the previous and the new specification
+    """
+    batch_size = 2
+    prev_params = {
+        "ar": cp.array([[0.5, 0.6]]),
+        "sigma2": cp.array([1.0, 1.1]),
+    }
+
+    # Intercept appears: start from a zero mu
+    start_params = auto_arima._pad_start_params(
+        prev_params, (1, 0, 0, 0, 0), (1, 0, 0, 0, 1), batch_size
+    )
+    np.testing.assert_array_equal(
+        cp.asnumpy(start_params["mu"]), np.zeros(batch_size)
+    )
+
+    # Intercept disappears: mu is dropped from the start parameters
+    prev_params["mu"] = cp.array([0.1, 0.2])
+    start_params = auto_arima._pad_start_params(
+        prev_params, (1, 0, 0, 0, 1), (1, 0, 0, 0, 0), batch_size
+    )
+    assert "mu" not in start_params
+
+
+def test_search_warm_start():
+    """Test that a warm-started grid search selects the same models and
+    reaches a comparable information criterion as a cold-started search
+    """
+    batch_size = 8
+    n_obs = 100
+    np.random.seed(42)
+
+    # AR(1) series with an intercept, so that low orders fit well
+    y = np.zeros((n_obs, batch_size), order="F")
+    noise = np.random.normal(scale=0.1, size=(n_obs, batch_size))
+    for t in range(1, n_obs):
+        y[t] = 0.05 + 0.7 * y[t - 1] + noise[t]
+
+    orders = []
+    ic_sums = []
+    for warm_start in [False, True]:
+        model = auto_arima.AutoARIMA(y)
+        model.search(
+            s=None, d=0, D=0, p=range(3), q=range(3), warm_start=warm_start
+        )
+        model.fit()
+
+        # Selected order of each series of the batch
+        id_to_model = model.id_to_model.to_output("numpy")
+        model_orders = [m.order for m in model.models]
+        orders.append([model_orders[i] for i in id_to_model])
+
+        # Sum of the in-sample information criteria over the batch
+        ic_sums.append(
+            sum(
+                float(m._ic("aicc").to_output("numpy").sum())
+                for m in model.models
+            )
+        )
+
+    assert orders[0] == orders[1]
+    np.testing.assert_allclose(ic_sums[0], ic_sums[1], rtol=1e-2)
@@ -111,5 +111,36 @@ def test_batched_lbfgs_rosenbrock():
     np.testing.assert_allclose(res_xk, res_true, rtol=1e-5)
 
 
+def test_batched_lbfgs_rosenbrock_fd_gradient():
+    """Test batched rosenbrock with the finite-difference gradient fallback
+    used when no gradient function is given"""
+
+    num_batches = 5
+    np.random.seed(42)
+    a = np.random.normal(1, scale=0.1, size=num_batches)
+    b = np.random.normal(100, scale=10, size=num_batches)
+
+    def f(x):
+        return batched_rosenbrock(x, num_batches, a, b)
+
+    x0 = np.zeros(2 * num_batches)
+
+    # analytical minimum
+    res_true = np.zeros(num_batches * 2)
+    for i in range(num_batches):
+        res_true[i * 2 : (i + 1) * 2] = np.array([a[i], a[i] ** 2])
+
+    # fprime=None: the gradient is estimated with batched central finite
+    # differences (one perturbed parameter per series and per evaluation)
+    res_xk, _, _ = batched_fmin_lbfgs_b(
+        f, x0, num_batches, fprime=None, iprint=-1, factr=100
+    )
+
+    # looser tolerance than with the analytical gradient, as the estimated
+    # gradient limits the accuracy of the solution
+    np.testing.assert_allclose(res_xk, res_true, rtol=1e-3)
+
+
 if __name__ == "__main__":
     test_batched_lbfgs_rosenbrock()
+    test_batched_lbfgs_rosenbrock_fd_gradient()
@@ -26,7 +26,6 @@ nvtx_annotate = gpu_only_import_from("nvtx", "annotate", alt=null_decorator)
 
 from libc.stdint cimport uintptr_t
 from libcpp cimport bool
-from libcpp.vector cimport vector
 from typing import Tuple, Dict, Mapping, Optional, Union
 
 import cuml.internals
@@ -153,6 +152,25 @@ cdef class ARIMAParamsWrapper:
         self.params.sigma2 = <double*> d_sigma2_ptr
 
 
+cdef class ARIMAMemoryWrapper:
+    """A wrapper class that owns an ARIMAMemory struct mapped onto the
+    pre-allocated temporary storage of a model"""
+    cdef ARIMAMemory[double]* arima_mem_ptr
+    cdef uintptr_t temp_mem_ptr
+
+    def __cinit__(self, model):
+        cdef ARIMAOrder order = model.order
+        cdef uintptr_t d_temp_mem = model._temp_mem.ptr
+        self.temp_mem_ptr = d_temp_mem
+        self.arima_mem_ptr = new ARIMAMemory[double](
+            order, <int> model.batch_size, <int> model.n_obs,
+            <char*> d_temp_mem)
+
+    def __dealloc__(self):
+        if self.arima_mem_ptr != NULL:
+            del self.arima_mem_ptr
+
+
 class ARIMA(Base):
     """
     Implements a batched ARIMA model for in- and out-of-sample
@@ -460,6 +478,29 @@ class ARIMA(Base):
             return "ARIMA({},{},{}) ({}) - {} series".format(
                 order.p, order.d, order.q, intercept_str, self.batch_size)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The ARIMAMemory wrapper holds raw pointers into _temp_mem and is
+        # re-created lazily after unpickling
+        state.pop("_arima_mem", None)
+        # The gradient scratch buffer is re-allocated on demand too
+        state.pop("_d_grad", None)
+        return state
+
+    @cuml.internals.api_base_return_any_skipall
+    def _get_arima_memory(self):
+        """Get the reusable ARIMAMemory wrapper, creating it on first use or
+        when the underlying temporary buffer has been reallocated
+        """
+        cdef ARIMAMemoryWrapper wrapper = None
+        cdef uintptr_t d_temp_mem = self._temp_mem.ptr
+        if hasattr(self, "_arima_mem"):
+            wrapper = self._arima_mem
+        if wrapper is None or wrapper.temp_mem_ptr != d_temp_mem:
+            wrapper = ARIMAMemoryWrapper(self)
+            self._arima_mem = wrapper
+        return wrapper
+
     @nvtx_annotate(message="tsa.arima.ARIMA._ic", domain="cuml_python")
     @cuml.internals.api_base_return_any_skipall
     def _ic(self, ic_type: str):
@@ -492,19 +533,14 @@ class ARIMA(Base):
         except KeyError as e:
             raise NotImplementedError("IC type '{}' unknown".format(ic_type))
 
-        cdef uintptr_t d_temp_mem = self._temp_mem.ptr
-        arima_mem_ptr = new ARIMAMemory[double](
-            order, <int> self.batch_size, <int> self.n_obs,
-            <char*> d_temp_mem)
+        cdef ARIMAMemoryWrapper arima_mem = self._get_arima_memory()
 
-        information_criterion(handle_[0], arima_mem_ptr[0],
+        information_criterion(handle_[0], arima_mem.arima_mem_ptr[0],
                               <double*> d_y_kf_ptr, <double*> d_exog_kf_ptr,
                               <int> self.batch_size, <int> n_obs_kf, order_kf,
                               cpp_params, <double*> d_ic_ptr,
                               <int> ic_type_id)
 
-        del arima_mem_ptr
-
         return ic
 
     @property
@@ -731,12 +767,9 @@ class ARIMA(Base):
         if order.n_exog:
             d_exog_ptr = self.d_exog.ptr
 
-        cdef uintptr_t d_temp_mem = self._temp_mem.ptr
-        arima_mem_ptr = new ARIMAMemory[double](
-            order, <int> self.batch_size, <int> self.n_obs,
-            <char*> d_temp_mem)
+        cdef ARIMAMemoryWrapper arima_mem = self._get_arima_memory()
 
-        cpp_predict(handle_[0], arima_mem_ptr[0], <double*>d_y_ptr,
+        cpp_predict(handle_[0], arima_mem.arima_mem_ptr[0], <double*>d_y_ptr,
                     <double*>d_exog_ptr, <double*>d_exog_fut_ptr,
                     <int> self.batch_size, <int> self.n_obs, <int> start,
                     <int> end, order, cpp_params, <double*>d_y_p_ptr,
@@ -744,8 +777,6 @@ class ARIMA(Base):
                     <double> (0 if level is None else level),
                     <double*> d_lower_ptr, <double*> d_upper_ptr)
 
-        del arima_mem_ptr
-
         if level is None:
             return d_y_p
         else:
@@ -972,8 +1003,10 @@ class ARIMA(Base):
         loglike : numpy.ndarray
             Batched log-likelihood. Shape: (batch_size,)
         """
-        cdef vector[double] vec_loglike
-        vec_loglike.resize(self.batch_size)
+        # The C++ call writes the log-likelihood directly into this
+        # host buffer
+        loglike = np.empty(self.batch_size, dtype=np.float64)
+        cdef uintptr_t h_loglike_ptr = loglike.ctypes.data
 
         cdef LoglikeMethod ll_method = CSS if method == "css" else MLE
         diff = ll_method != MLE or self.simple_differencing
@@ -1000,20 +1033,16 @@ class ARIMA(Base):
 
         n_obs_kf = (self.n_obs_diff if diff else self.n_obs)
 
-        cdef uintptr_t d_temp_mem = self._temp_mem.ptr
-        arima_mem_ptr = new ARIMAMemory[double](
-            order, <int> self.batch_size, <int> self.n_obs,
-            <char*> d_temp_mem)
+        cdef ARIMAMemoryWrapper arima_mem = self._get_arima_memory()
 
-        batched_loglike(handle_[0], arima_mem_ptr[0], <double*> d_y_kf_ptr,
-                        <double*> d_exog_kf_ptr, <int> self.batch_size,
+        batched_loglike(handle_[0], arima_mem.arima_mem_ptr[0],
+                        <double*> d_y_kf_ptr, <double*> d_exog_kf_ptr,
+                        <int> self.batch_size,
                         <int> n_obs_kf, order_kf, <double*> d_x_ptr,
-                        <double*> vec_loglike.data(), <bool> trans,
+                        <double*> h_loglike_ptr, <bool> trans,
                         <bool> True, ll_method, <int> truncate)
 
-        del arima_mem_ptr
-
-        return np.array(vec_loglike, dtype=np.float64)
+        return loglike
 
     @nvtx_annotate(message="tsa.arima.ARIMA._loglike_grad",
                    domain="cuml_python")
@@ -1052,7 +1081,10 @@ class ARIMA(Base):
         cdef LoglikeMethod ll_method = CSS if method == "css" else MLE
         diff = ll_method != MLE or self.simple_differencing
 
-        grad = CumlArray.empty(N * self.batch_size, np.float64)
+        # The gradient buffer is reused across optimizer iterations
+        if not hasattr(self, "_d_grad"):
+            self._d_grad = CumlArray.empty(N * self.batch_size, np.float64)
+        grad = self._d_grad
         cdef uintptr_t d_grad = <uintptr_t> grad.ptr
 
         cdef ARIMAOrder order = self.order
@@ -1075,12 +1107,9 @@ class ARIMA(Base):
 
         cdef handle_t* handle_ = <handle_t*><size_t>self.handle.getHandle()
 
-        cdef uintptr_t d_temp_mem = self._temp_mem.ptr
-        arima_mem_ptr = new ARIMAMemory[double](
-            order, <int> self.batch_size, <int> self.n_obs,
-            <char*> d_temp_mem)
+        cdef ARIMAMemoryWrapper arima_mem = self._get_arima_memory()
 
-        batched_loglike_grad(handle_[0], arima_mem_ptr[0],
+        batched_loglike_grad(handle_[0], arima_mem.arima_mem_ptr[0],
                              <double*> d_y_kf_ptr, <double*> d_exog_kf_ptr,
                              <int> self.batch_size,
                              <int> (self.n_obs_diff if diff else self.n_obs),
@@ -1088,8 +1117,6 @@ class ARIMA(Base):
                              <double> h, <bool> trans, ll_method,
                              <int> truncate)
 
-        del arima_mem_ptr
-
         return grad.to_output("numpy")
 
     @property
@@ -1102,8 +1129,10 @@ class ARIMA(Base):
 
         cdef handle_t* handle_ = <handle_t*><size_t>self.handle.getHandle()
 
-        cdef vector[double] vec_loglike
-        vec_loglike.resize(self.batch_size)
+        # The C++ call writes the log-likelihood directly into this
+        # host buffer
+        loglike = np.empty(self.batch_size, dtype=np.float64)
+        cdef uintptr_t h_loglike_ptr = loglike.ctypes.data
 
         cdef ARIMAOrder order = self.order
         cdef ARIMAOrder order_kf = \
@@ -1123,20 +1152,16 @@ class ARIMA(Base):
 
         cdef LoglikeMethod ll_method = MLE
 
-        cdef uintptr_t d_temp_mem = self._temp_mem.ptr
-        arima_mem_ptr = new ARIMAMemory[double](
-            order, <int> self.batch_size, <int> self.n_obs,
-            <char*> d_temp_mem)
+        cdef ARIMAMemoryWrapper arima_mem = self._get_arima_memory()
 
-        batched_loglike(handle_[0], arima_mem_ptr[0], <double*> d_y_kf_ptr,
-                        <double*> d_exog_kf_ptr, <int> self.batch_size,
+        batched_loglike(handle_[0], arima_mem.arima_mem_ptr[0],
+                        <double*> d_y_kf_ptr, <double*> d_exog_kf_ptr,
+                        <int> self.batch_size,
                         <int> n_obs_kf, order_kf, cpp_params,
-                        <double*> vec_loglike.data(), <bool> False,
+                        <double*> h_loglike_ptr, <bool> False,
                         <bool> True, ll_method, <int> 0)
 
-        del arima_mem_ptr
-
-        return np.array(vec_loglike, dtype=np.float64)
+        return loglike
 
     @nvtx_annotate(message="tsa.arima.ARIMA.unpack", domain="cuml_python")
     def unpack(self, x: Union[list, np.ndarray], convert_dtype=True):
@@ -1213,19 +1238,16 @@ class ARIMA(Base):
         N = self.complexity
 
         cdef handle_t* handle_ = <handle_t*><size_t>self.handle.getHandle()
-        Tx = np.zeros(self.batch_size * N)
+        # batched_jones_transform overwrites the whole output vector
+        Tx = np.empty(self.batch_size * N)
 
-        cdef uintptr_t d_temp_mem = self._temp_mem.ptr
-        arima_mem_ptr = new ARIMAMemory[double](
-            order, <int> self.batch_size, <int> self.n_obs,
-            <char*> d_temp_mem)
+        cdef ARIMAMemoryWrapper arima_mem = self._get_arima_memory()
 
         cdef uintptr_t x_ptr = x.ctypes.data
         cdef uintptr_t Tx_ptr = Tx.ctypes.data
         batched_jones_transform(
-            handle_[0], arima_mem_ptr[0], order, <int> self.batch_size,
-            <bool> isInv, <double*>x_ptr, <double*>Tx_ptr)
-
-        del arima_mem_ptr
+            handle_[0], arima_mem.arima_mem_ptr[0], order,
+            <int> self.batch_size, <bool> isInv, <double*>x_ptr,
+            <double*>Tx_ptr)
 
         return (Tx)
@@ -238,7 +238,8 @@ class AutoARIMA(Base):
                h: float = 1e-8,
                maxiter: int = 1000,
                method="auto",
-               truncate: int = 0):
+               truncate: int = 0,
+               warm_start: bool = False):
         """Searches through the specified model space and associates each
         series to the most appropriate model.
 
@@ -284,6 +285,12 @@ class AutoARIMA(Base):
             When using CSS, start the sum of squares after a given number of
             observations for better performance. Recommended for long time
             series when truncating doesn't lose too much information.
+        warm_start : bool
+            When True, each specification in the grid search is seeded with
+            the fitted parameters of the previous specification whenever its
+            orders are larger or equal (new lags start at zero), typically
+            reducing the number of optimizer iterations per fit. When False,
+            every fit starts from its own initial estimate.
         """
         # Notes:
         #  - We iteratively divide the dataset as we decide parameters, so
@@ -303,7 +310,7 @@ class AutoARIMA(Base):
             method = "css" if self.n_obs >= 100 and s >= 4 else "ml"
 
         # Original index
-        d_index, *_ = input_to_cuml_array(np.r_[:self.batch_size],
+        d_index, *_ = input_to_cuml_array(np.arange(self.batch_size),
                                           convert_to_dtype=np.int32)
 
         #
@@ -392,13 +399,15 @@ class AutoARIMA(Base):
             # Grid search
             all_ic = []
             all_orders = []
+            data_temp_cp = data_temp.to_output("cupy")
+            prev_fit, prev_spec = None, None
             for p_, q_, P_, Q_, k_ in itertools.product(p_options, q_options,
                                                         P_options, Q_options,
                                                         k_options):
                 if p_ + q_ + P_ + Q_ + k_ == 0:
                     continue
                 s_ = s if (P_ + D_ + Q_) else 0
-                model = ARIMA(endog=data_temp.to_output("cupy"),
+                model = ARIMA(endog=data_temp_cp,
                               order=(p_, d_, q_),
                               seasonal_order=(P_, D_, Q_, s_),
                               fit_intercept=k_,
@@ -406,8 +415,16 @@ class AutoARIMA(Base):
                               simple_differencing=self.simple_differencing,
                               output_type="cupy")
                 logger.debug("Fitting {} ({})".format(model, method))
-                model.fit(h=h, maxiter=maxiter, method=method,
-                          truncate=truncate)
+                start_params = None
+                if warm_start and prev_fit is not None:
+                    start_params = _pad_start_params(
+                        prev_fit, prev_spec, (p_, q_, P_, Q_, k_),
+                        batch_size)
+                model.fit(start_params=start_params, h=h, maxiter=maxiter,
+                          method=method, truncate=truncate)
+                if warm_start:
+                    prev_fit = model.get_fit_params()
+                    prev_spec = (p_, q_, P_, Q_, k_)
                 all_ic.append(model._ic(ic))
                 all_orders.append((p_, q_, P_, Q_, s_, k_))
                 del model
@@ -568,6 +585,34 @@ class AutoARIMA(Base):
 
 # Helper functions
 
+def _pad_start_params(prev_params, prev_spec, spec, batch_size):
+    """Build warm-start parameters for a model specification from the fit
+    parameters of a previous specification with smaller or equal orders,
+    padding the new AR/MA lags with zeros.
+
+    Zero-padding leaves the AR/MA polynomials of the previous fit unchanged,
+    so stationarity and invertibility are preserved. Returns None when any
+    order shrinks, as truncating lags could produce an invalid start point.
+    """
+    p, q, P, Q, k = spec
+    prev_p, prev_q, prev_P, prev_Q, _ = prev_spec
+    if p < prev_p or q < prev_q or P < prev_P or Q < prev_Q:
+        return None
+
+    start_params = {"sigma2": prev_params["sigma2"]}
+    if k:
+        start_params["mu"] = (prev_params["mu"] if "mu" in prev_params
+                              else cp.zeros(batch_size))
+    for name, size, prev_size in (("ar", p, prev_p), ("ma", q, prev_q),
+                                  ("sar", P, prev_P), ("sma", Q, prev_Q)):
+        if size:
+            params = cp.zeros((size, batch_size))
+            if prev_size:
+                params[:prev_size] = prev_params[name]
+            start_params[name] = params
+    return start_params
+
+
 def _parse_sequence(name, seq_in, min_accepted, max_accepted):
     """Convert a sequence/generator/integer into a sorted list, keeping
     only values within the accepted range
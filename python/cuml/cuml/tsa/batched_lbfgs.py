@@ -26,17 +26,31 @@ nvtx_annotate = gpu_only_import_from("nvtx", "annotate", alt=null_decorator)
 np = cpu_only_import("numpy")
 
 
-def _fd_fprime(x, f, h):
-    """(internal) Computes finite difference."""
-    g = np.zeros(len(x))
-    for i in range(len(x)):
-        xph = np.copy(x)
-        xmh = np.copy(x)
-        xph[i] += h
-        xmh[i] -= h
+def _fd_fprime(x, f, h, num_batches=1, work=None):
+    """(internal) Computes a batched central finite difference.
+
+    The loss of each batch member depends only on its own parameters, so a
+    single evaluation of `f` with the same parameter index perturbed in
+    every batch member yields one finite difference per member. This needs
+    `2 * n` evaluations of `f` (n = parameters per batch member) instead of
+    `2 * len(x)`.
+
+    `work` is an optional scratch array of shape (3, len(x)) that can be
+    passed to reuse the perturbation buffers across calls; the returned
+    gradient is a view of it, valid until the next call.
+    """
+    n = len(x) // num_batches
+    if work is None:
+        work = np.empty((3, len(x)))
+    g, xph, xmh = work
+    for i in range(n):
+        xph[:] = x
+        xmh[:] = x
+        xph[i::n] += h
+        xmh[i::n] -= h
         fph = f(xph)
         fmh = f(xmh)
-        g[i] = (fph - fmh) / (2 * h)
+        g[i::n] = (fph - fmh) / (2 * h)
 
     return g
 
@@ -106,9 +120,12 @@ def batched_fmin_lbfgs_b(
     n = len(x0) // num_batches
 
     if fprime is None:
+        # Scratch space shared by all finite-difference evaluations of the
+        # optimizer run
+        fd_work = np.empty((3, len(x0)))
 
         def fprime_f(x):
-            return _fd_fprime(x, func, epsilon)
+            return _fd_fprime(x, func, epsilon, num_batches, work=fd_work)
 
         fprime = fprime_f
 
@@ -129,34 +146,32 @@ def batched_fmin_lbfgs_b(
             ub = 1
         nbd[i] = bounds_map[lb, ub]
 
-    # working arrays needed by L-BFGS-B implementation in SciPy.
-    # One for each series
-    x = [
-        np.copy(np.array(x0[ib * n : (ib + 1) * n], np.float64))
-        for ib in range(num_batches)
-    ]
-    f = [np.copy(np.array(0.0, np.float64)) for ib in range(num_batches)]
-    g = [np.copy(np.zeros((n,), np.float64)) for ib in range(num_batches)]
-    wa = [
-        np.copy(np.zeros(2 * m * n + 5 * n + 11 * m * m + 8 * m, np.float64))
-        for ib in range(num_batches)
-    ]
-    iwa = [np.copy(np.zeros(3 * n, np.int32)) for ib in range(num_batches)]
-    task = [np.copy(np.zeros(1, "S60")) for ib in range(num_batches)]
-    csave = [np.copy(np.zeros(1, "S60")) for ib in range(num_batches)]
-    lsave = [np.copy(np.zeros(4, np.int32)) for ib in range(num_batches)]
-    isave = [np.copy(np.zeros(44, np.int32)) for ib in range(num_batches)]
-    dsave = [np.copy(np.zeros(29, np.float64)) for ib in range(num_batches)]
-    for ib in range(num_batches):
-        task[ib][:] = "START"
+    # Working arrays needed by the L-BFGS-B implementation in SciPy, stored
+    # as one contiguous matrix per variable with one row per series, so that
+    # the full parameter vector is a view of `x` rather than a concatenation
+    x = np.array(x0, np.float64).reshape(num_batches, n)
+    g = np.zeros((num_batches, n), np.float64)
+    wa = np.zeros(
+        (num_batches, 2 * m * n + 5 * n + 11 * m * m + 8 * m), np.float64
+    )
+    iwa = np.zeros((num_batches, 3 * n), np.int32)
+    task = np.zeros((num_batches, 1), "S60")
+    csave = np.zeros((num_batches, 1), "S60")
+    lsave = np.zeros((num_batches, 4), np.int32)
+    isave = np.zeros((num_batches, 44), np.int32)
+    dsave = np.zeros((num_batches, 29), np.float64)
+    # The objective value is a scalar in/out argument of setulb, so it
+    # remains one 0-d array per series
+    f = [np.zeros((), np.float64) for ib in range(num_batches)]
+    task[:] = "START"
 
     n_iterations = np.zeros(num_batches, dtype=np.int32)
 
-    converged = num_batches * [False]
+    converged = np.zeros(num_batches, dtype=bool)
 
     warn_flag = np.zeros(num_batches)
 
-    while not all(converged):
+    while not converged.all():
         with nvtx_annotate("LBFGS-ITERATION", domain="cuml_python"):
             for ib in range(num_batches):
                 if converged[ib]:
@@ -183,14 +198,22 @@ def batched_fmin_lbfgs_b(
                     maxls,
                 )
 
-            xk = np.concatenate(x)
-            fk = func(xk)
-            gk = fprime(xk)
+            # The objective and gradient are evaluated for the whole batch
+            # in one GPU launch each: skip them entirely when no active
+            # series requests an evaluation (e.g. all tasks are NEW_X)
+            tasks = [task[ib].tobytes() for ib in range(num_batches)]
+            if any(
+                not converged[ib] and tasks[ib].startswith(b"FG")
+                for ib in range(num_batches)
+            ):
+                xk = x.ravel()
+                fk = func(xk)
+                gk = fprime(xk)
             for ib in range(num_batches):
                 if converged[ib]:
                     continue
-                task_str = task[ib].tobytes()
-                task_str_strip = task[ib].tobytes().strip(b"\x00").strip()
+                task_str = tasks[ib]
+                task_str_strip = task_str.strip(b"\x00").strip()
                 if task_str.startswith(b"FG"):
                     # needs function evaluation
                     f[ib] = fk[ib]
@@ -209,7 +232,7 @@ def batched_fmin_lbfgs_b(
                     warn_flag[ib] = 2
                     continue
 
-    xk = np.concatenate(x)
+    xk = x.ravel()
 
     if iprint > 0:
         logger.info(